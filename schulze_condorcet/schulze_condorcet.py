@@ -1,80 +1,182 @@
+import collections
+import functools
+import itertools
+import operator
 from gettext import gettext as _
 from typing import (
-    Collection, Container, List, Mapping, Tuple, Sequence
+    Callable, Collection, Dict, List, Mapping, Tuple, Sequence
 )
 
 from schulze_condorcet.util import (
-    as_vote_string, as_vote_tuples, validate_candidates, validate_votes
+    as_vote_string, validate_candidates, validate_votes
 )
-from schulze_condorcet.strength import winning_votes
+from schulze_condorcet.strength import _matrix_strength, winning_votes
 from schulze_condorcet.types import (
-    Candidate, DetailedResultLevel, LinkStrength, PairwisePreference, SchulzeResult,
-    StrengthCallback, VoteString
+    Candidate, DetailedResultLevel, PairwisePreference, PreferenceMatrix, SchulzeResult,
+    StrengthCallback, StrengthMatrix, VoteRanks, VoteString
 )
 
 
-def _schulze_winners(d: Mapping[Tuple[Candidate, Candidate], int],
+# Up to this number of candidates, the search for the strongest paths is done by
+# generated code specialised for the number of candidates.
+_UNROLL_LIMIT = 8
+
+
+@functools.lru_cache(maxsize=None)
+def _unrolled_strongest_paths(n: int) -> Callable[[List[int]], None]:
+    """Generate a function determining the strongest paths between n candidates.
+
+    The generated function works in place on the row-major flattened matrix of link
+    strengths. Knowing the number of candidates in advance allows to unroll all loops
+    of the Floyd–Warshall algorithm, removing the whole loop and index bookkeeping.
+    """
+    lines = ["def strongest_paths(p):"]
+    for i in range(n):
+        for j in range(n):
+            if j == i:
+                continue
+            lines.append(f"    p_ji = p[{j * n + i}]")
+            for k in range(n):
+                if k in {i, j}:
+                    continue
+                lines.append(f"    m = p[{i * n + k}] if p[{i * n + k}] < p_ji else p_ji")
+                lines.append(f"    if p[{j * n + k}] < m: p[{j * n + k}] = m")
+    lines.append("    return")
+    namespace: Dict[str, Callable[[List[int]], None]] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["strongest_paths"]
+
+
+def _strongest_paths(p: StrengthMatrix) -> None:
+    """Determine the strongest paths between all candidates, in place.
+
+    This is a variant of the Floyd–Warshall algorithm to determine the widest path.
+    The diagonal does not need special treatment: it never widens any other path and
+    the winners are not affected by it.
+    """
+    for i, p_i in enumerate(p):
+        for j, p_j in enumerate(p):
+            if j == i:
+                # a path can not be widened by going through its own start
+                continue
+            p_ji = p_j[i]
+            for k, p_ik in enumerate(p_i):
+                m = p_ik if p_ik < p_ji else p_ji
+                if p_j[k] < m:
+                    p_j[k] = m
+
+
+def _schulze_winners(d: StrengthMatrix,
                      candidates: Sequence[Candidate]) -> List[Candidate]:
     """This is the abstract part of the Schulze method doing the actual work.
 
     The candidates are the vertices of a graph and the metric (in form
     of ``d``) describes the strength of the links between the
-    candidates, that is edge weights.
+    candidates, that is edge weights. ``d`` is a matrix indexed by the
+    position of the candidates, so ``d[x][y]`` is the strength of the link
+    from ``candidates[x]`` to ``candidates[y]``.
 
     We determine the strongest path from each vertex to each other
     vertex. This gives a transitive relation, which enables us thus to
     determine winners as maximal elements.
     """
+    # If the weakest link from a candidate to the others is stronger than all links
+    # from the others to it, it is the only winner, since each path to the candidate
+    # ends with one of those links. This spares the search for the strongest paths in
+    # the common case that there is a Condorcet winner.
+    if len(candidates) > 1:
+        for x, (candidate, row, column) in enumerate(zip(candidates, d, zip(*d))):
+            if min(row[:x] + row[x+1:]) > max(column[:x] + column[x+1:]):
+                return [candidate]
+
     # First determine the strongest paths
-    # This is a variant of the Floyd–Warshall algorithm to determine the
-    # widest path.
-    p = {(x, y): d[(x, y)] for x in candidates for y in candidates}
-    for i in candidates:
-        for j in candidates:
-            if i == j:
-                continue
-            for k in candidates:
-                if k in {i, j}:
-                    continue
-                p[(j, k)] = max(p[(j, k)], min(p[(j, i)], p[(i, k)]))
+    n = len(candidates)
+    if n <= _UNROLL_LIMIT:
+        flat = [strength for row in d for strength in row]
+        _unrolled_strongest_paths(n)(flat)
+        p = [flat[x * n:(x + 1) * n] for x in range(n)]
+    else:
+        p = [list(row) for row in d]
+        _strongest_paths(p)
     # Second determine winners
     winners = []
-    for i in candidates:
-        if all(p[(i, j)] >= p[(j, i)] for j in candidates):
-            winners.append(i)
+    for candidate, row, column in zip(candidates, p, zip(*p)):
+        if all(p_xy >= p_yx for p_xy, p_yx in zip(row, column)):
+            winners.append(candidate)
     return winners
 
 
-def _subindex(alist: Collection[Container[str]], element: str) -> int:
-    """The element is in the list at which position in the big list.
+def _vote_ranks(
+        votes: Collection[str],
+        candidates: Sequence[Candidate],
+) -> Dict[VoteRanks, int]:
+    """Validate the votes and convert each of them into the level of each candidate.
+
+    This does the same checks as validate_votes, but parses each vote string only once.
+    Since identical votes contribute identically to the result, we parse each distinct
+    vote only once and keep track of how often it was cast instead.
 
-    :returns: ``ret`` such that ``element in alist[ret]``
+    :returns: The number of votes per distinct ranking of the candidates.
     """
-    for index, sublist in enumerate(alist):
-        if element in sublist:
-            return index
-    raise ValueError(_("Not in list."))
+    index: Dict[str, int] = {candidate: x for x, candidate in enumerate(candidates)}
+    # Like validate_votes, we accept duplicated candidates, which each vote names only
+    # once. Their other positions get the level of the position in the index.
+    duplicates = [(x, index[candidate]) for x, candidate in enumerate(candidates)
+                  if index[candidate] != x]
+    ret: Dict[VoteRanks, int] = {}
+    for vote, multiplicity in collections.Counter(votes).items():
+        ranks = [-1] * len(candidates)
+        try:
+            for level, candidates_on_level in enumerate(vote.split('>')):
+                for candidate in candidates_on_level.split('='):
+                    ranks[index[candidate]] = level
+        except KeyError:
+            valid = False
+        else:
+            for x, y in duplicates:
+                ranks[x] = ranks[y]
+            # every candidate is present and there are no more than the candidates
+            valid = (-1 not in ranks
+                     and vote.count('>') + vote.count('=') + 1 == len(index))
+        if not valid:
+            # let the slow path determine the precise error
+            validate_votes([vote], candidates)
+            raise ValueError(_("Invalid vote string."))
+        key = tuple(ranks)
+        ret[key] = ret.get(key, 0) + multiplicity
+    return ret
 
 
 def _pairwise_preference(
-        votes: Collection[VoteString],
+        votes: Mapping[VoteRanks, int],
         candidates: Sequence[Candidate],
-) -> PairwisePreference:
+) -> PreferenceMatrix:
     """Calculate the pairwise preference of all candidates from all given votes."""
-    counts = {(x, y): 0 for x in candidates for y in candidates}
-    for vote in as_vote_tuples(votes):
-        for x in candidates:
-            for y in candidates:
-                if _subindex(vote, x) < _subindex(vote, y):
-                    counts[(x, y)] += 1
-    return counts
+    if not votes:
+        return [[0] * len(candidates) for _ in candidates]
+    multiplicities = list(votes.values())
+    # the ranks of each candidate in all votes, indexed by the position of the candidates
+    columns = list(zip(*votes))
+    # sum up the multiplicities of all votes in which x is ranked higher than y
+    return [[sum(itertools.compress(multiplicities, map(operator.lt, ranks_x, ranks_y)))
+             for ranks_y in columns]
+            for ranks_x in columns]
+
+
+def _as_pairwise_preference(
+        counts: PreferenceMatrix,
+        candidates: Sequence[Candidate],
+) -> PairwisePreference:
+    """Convert the positional matrix of pairwise preferences into a mapping."""
+    return {(x, y): count
+            for x, row in zip(candidates, counts) for y, count in zip(candidates, row)}
 
 
 def _schulze_evaluate_routine(
-        votes: Collection[VoteString],
+        votes: Mapping[VoteRanks, int],
         candidates: Sequence[Candidate],
         strength: StrengthCallback
-) -> Tuple[PairwisePreference, SchulzeResult]:
+) -> Tuple[PreferenceMatrix, SchulzeResult]:
     """The routine to determine the result of the schulze-condorcet method.
 
     This is outsourced into this helper function to avoid duplicate code or duplicate
@@ -82,24 +184,29 @@ def _schulze_evaluate_routine(
     """
     # First we count the number of votes preferring x to y
     counts = _pairwise_preference(votes, candidates)
+    totalvotes = sum(votes.values())
 
     # Second we calculate a numeric link strength abstracting the problem into the realm
     # of graphs with one vertex per candidate
-    d: LinkStrength = {(x, y): strength(support=counts[(x, y)],
-                                        opposition=counts[(y, x)],
-                                        totalvotes=len(votes))
-                       for x in candidates for y in candidates}
+    matrix_strength = _matrix_strength(strength)
+    d: StrengthMatrix
+    if matrix_strength is not None:
+        d = matrix_strength(counts, totalvotes)
+    else:
+        d = [[strength(support=support, opposition=opposition, totalvotes=totalvotes)
+              for support, opposition in zip(row, column)]
+             for row, column in zip(counts, zip(*counts))]
 
     # Third we execute the Schulze method by iteratively determining winners
     result: SchulzeResult = []
-    while True:
-        done = {x for level in result for x in level}
-        # avoid sets to preserve ordering
-        remaining = tuple(c for c in candidates if c not in done)
-        if not remaining:
-            break
-        winners = _schulze_winners(d, remaining)
+    # avoid sets to preserve ordering
+    remaining = list(range(len(candidates)))
+    while remaining:
+        winners = _schulze_winners([[d[x][y] for y in remaining] for x in remaining],
+                                   [candidates[x] for x in remaining])
         result.append(winners)
+        done = set(winners)
+        remaining = [x for x in remaining if candidates[x] not in done]
 
     return counts, result
 
@@ -139,9 +246,9 @@ def schulze_evaluate(
     """
     # Validate votes and candidate input to be consistent
     candidates = validate_candidates(candidates)
-    votes = validate_votes(votes, candidates)
+    ranks = _vote_ranks(votes, candidates)
 
-    _, result = _schulze_evaluate_routine(votes, candidates, strength)
+    _, result = _schulze_evaluate_routine(ranks, candidates, strength)
 
     # Construct a vote string reflecting the overall preference
     return as_vote_string(result)
@@ -160,9 +267,10 @@ def schulze_evaluate_detailed(
     """
     # Validate votes and candidate input to be consistent
     candidates = validate_candidates(candidates)
-    votes = validate_votes(votes, candidates)
+    ranks = _vote_ranks(votes, candidates)
 
-    counts, result = _schulze_evaluate_routine(votes, candidates, strength)
+    counts, result = _schulze_evaluate_routine(ranks, candidates, strength)
+    index = {candidate: x for x, candidate in enumerate(candidates)}
 
     # Construct the DetailedResult. This contains a list of dicts, one for each
     # level of preference, containing the preferred and rejected candidates and the
@@ -170,18 +278,20 @@ def schulze_evaluate_detailed(
     # pairwise combinations of preferred and rejected candidates.
     detailed: List[DetailedResultLevel] = list()
     for preferred_candidates, rejected_candidates in zip(result, result[1:]):
+        support: PairwisePreference = {}
+        opposition: PairwisePreference = {}
+        for preferred in preferred_candidates:
+            preferred_index = index[preferred]
+            for rejected in rejected_candidates:
+                rejected_index = index[rejected]
+                support[(preferred, rejected)] = counts[preferred_index][rejected_index]
+                opposition[(preferred, rejected)] = counts[rejected_index][preferred_index]
         level: DetailedResultLevel = {
             # TODO maybe use simply tuples instead of lists here?
             'preferred': list(preferred_candidates),
             'rejected': list(rejected_candidates),
-            'support': {
-                (preferred, rejected): counts[preferred, rejected]
-                for preferred in preferred_candidates
-                for rejected in rejected_candidates},
-            'opposition': {
-                (preferred, rejected): counts[rejected, preferred]
-                for preferred in preferred_candidates
-                for rejected in rejected_candidates}
+            'support': support,
+            'opposition': opposition,
         }
         detailed.append(level)
     return detailed
@@ -199,6 +309,6 @@ def pairwise_preference(
     """
     # Validate votes and candidate input to be consistent
     candidates = validate_candidates(candidates)
-    votes = validate_votes(votes, candidates)
+    ranks = _vote_ranks(votes, candidates)
 
-    return _pairwise_preference(votes, candidates)
+    return _as_pairwise_preference(_pairwise_preference(ranks, candidates), candidates)
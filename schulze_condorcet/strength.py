@@ -16,6 +16,10 @@ strength function (`StrenghtCallback` in module `schulze_condorcet.types`).
 You can use it to implement your own strength function.
 """
 
+from typing import Callable, Optional, Tuple
+
+from schulze_condorcet.types import PreferenceMatrix, StrengthCallback, StrengthMatrix
+
 
 def winning_votes(*, support: int, opposition: int, totalvotes: int) -> int:
     """This strategy is also advised by the paper of Markus Schulze.
@@ -43,3 +47,37 @@ def margin(*, support: int, opposition: int, totalvotes: int) -> int:
     equivalent.
     """
     return support - opposition
+
+
+def _winning_votes_matrix(counts: PreferenceMatrix, totalvotes: int) -> StrengthMatrix:
+    """Apply `winning_votes` to all links between the candidates at once."""
+    return [[totalvotes * support - opposition if support > opposition
+             else 0 if support == opposition else -1
+             for support, opposition in zip(row, column)]
+            for row, column in zip(counts, zip(*counts))]
+
+
+def _margin_matrix(counts: PreferenceMatrix, totalvotes: int) -> StrengthMatrix:
+    """Apply `margin` to all links between the candidates at once."""
+    return [[support - opposition for support, opposition in zip(row, column)]
+            for row, column in zip(counts, zip(*counts))]
+
+
+# Versions of the strength functions above, which take the whole matrix of pairwise
+# preferences (where the opposition of a link is the transposed entry) and return the
+# whole matrix of link strengths. This spares one function call per link.
+_MATRIX_STRENGTHS: Tuple[Tuple[StrengthCallback,
+                               Callable[[PreferenceMatrix, int], StrengthMatrix]], ...] = (
+    (winning_votes, _winning_votes_matrix),
+    (margin, _margin_matrix),
+)
+
+
+def _matrix_strength(
+        strength: StrengthCallback
+) -> Optional[Callable[[PreferenceMatrix, int], StrengthMatrix]]:
+    """Return the matrix version of the given strength function, if there is one."""
+    for scalar, matrix in _MATRIX_STRENGTHS:
+        if strength is scalar:
+            return matrix
+    return None
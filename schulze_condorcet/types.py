@@ -14,10 +14,17 @@ Candidate = NewType('Candidate', str)
 VoteTuple = Tuple[Tuple[Candidate, ...], ...]
 # We accept VoteLists instead of VoteTuples for convenience.
 VoteList = List[List[Candidate]]
+# A single vote, represented by the level of each candidate (starting with zero for the
+# most preferred ones), indexed by the position of the candidates.
+VoteRanks = Tuple[int, ...]
 # How many voters prefer the first candidate over the second candidate.
 PairwisePreference = Dict[Tuple[Candidate, Candidate], int]
+# The same as PairwisePreference, but indexed by the position of the candidates.
+PreferenceMatrix = List[List[int]]
 # The link strength between two candidates.
 LinkStrength = Dict[Tuple[Candidate, Candidate], int]
+# The same as LinkStrength, but indexed by the position of the candidates.
+StrengthMatrix = List[List[int]]
 # The result of the schulze_condorcet method. This has the same structure as a VoteList.
 SchulzeResult = List[List[Candidate]]
 
@@ -5,9 +5,8 @@ string-based representations of votes (like 'a>b=c=d>e') into the level-based
 representations of votes (like [[a], [b, c, d], [e]]) and vice versa.
 """
 
-import itertools
 from gettext import gettext as _
-from typing import Collection, List, Sequence, Union
+from typing import Collection, List, Sequence, Union, cast
 
 from schulze_condorcet.types import Candidate, VoteList, VoteString, VoteTuple
 
@@ -18,9 +17,11 @@ def validate_candidates(candidates: Sequence[str]) -> Sequence[Candidate]:
     We respect the order of the candidates, as this is also respected during evaluation
     of the votes using the schulze method."""
 
-    if any(">" in candidate or "=" in candidate for candidate in candidates):
+    # the forbidden characters are single characters, so they can not arise from joining
+    joined = "".join(candidates)
+    if ">" in joined or "=" in joined:
         raise ValueError(_("A candidate contains a forbidden character."))
-    return [Candidate(candidate) for candidate in candidates]
+    return cast(List[Candidate], list(candidates))
 
 
 def validate_votes(votes: Collection[str], candidates: Sequence[str]) -> Collection[VoteString]:
@@ -31,8 +32,11 @@ def validate_votes(votes: Collection[str], candidates: Sequence[str]) -> Collect
     """
     candidates = validate_candidates(candidates)
     candidates_set = set(candidates)
-    for vote in as_vote_tuples(votes):
-        vote_candidates = [c for c in itertools.chain.from_iterable(vote)]
+    # Identical votes need to be checked only once. Keep the order of their first
+    # occurrence, so the first invalid vote determines the error, as before.
+    for vote in dict.fromkeys(votes):
+        # the levels of the vote do not matter here, so we skip building them
+        vote_candidates = vote.replace('>', '=').split('=')
         vote_candidates_set = set(vote_candidates)
         if candidates_set != vote_candidates_set:
             if candidates_set < vote_candidates_set:
@@ -41,7 +45,7 @@ def validate_votes(votes: Collection[str], candidates: Sequence[str]) -> Collect
                 raise ValueError(_("Missing candidate in vote string."))
         if not len(vote_candidates) == len(vote_candidates_set):
             raise ValueError(_("Every candidate must occur exactly once in each vote."))
-    return [VoteString(vote) for vote in votes]
+    return cast(List[VoteString], list(votes))
 
 
 def as_vote_string(
@@ -49,7 +53,8 @@ def as_vote_string(
 ) -> VoteString:
     """Convert a level-based representation of the vote into its string representation."""
     if isinstance(value, (list, tuple)):
-        return VoteString(">".join("=".join(level) for level in value))
+        # str.join materializes its argument anyway, so we pass a list right away
+        return VoteString(">".join(["=".join(level) for level in value]))
     else:
         raise NotImplementedError(value)
 
@@ -65,13 +70,8 @@ def as_vote_tuple(
         value: Union[str, VoteString]
 ) -> VoteTuple:
     """Convert a string representation of a vote into its level-based representation."""
-    return (
-        tuple(
-            tuple(
-                Candidate(candidate) for candidate in level.split('=')
-            ) for level in value.split('>')
-        )
-    )
+    # Candidate is only a NewType of str, so we spare calling it for each candidate
+    return cast(VoteTuple, tuple(tuple(level.split('=')) for level in value.split('>')))
 
 
 def as_vote_tuples(
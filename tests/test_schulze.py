@@ -1,471 +1,500 @@
-import datetime
+import itertools
 import random
-from typing import Dict, List, Optional, Tuple, TypedDict
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 import unittest
 
+import schulze_condorcet.schulze_condorcet
 from schulze_condorcet import schulze_evaluate, schulze_evaluate_detailed
 import schulze_condorcet.util as util
 from schulze_condorcet.strength import margin, winning_votes
 from schulze_condorcet.types import Candidate, DetailedResultLevel as DRL, VoteString
 
 
-class ClassicalTestCase(TypedDict):
+class ClassicalTestCase(NamedTuple):
     input: Dict[Optional[Tuple[Candidate, ...]], int]
     condensed: VoteString
     detailed: List[DRL]
 
 
-class PreferentialTestCase(TypedDict):
-    input: List[VoteString]
+class PreferentialTestCase(NamedTuple):
+    input: Tuple[VoteString, ...]
     condensed: VoteString
     detailed: List[DRL]
 
 
+def _random_votes(rng: random.Random, candidates: Sequence[Candidate],
+                  number: int) -> List[VoteString]:
+    """Generate the given number of random votes, each containing every candidate."""
+    votes = []
+    # candidates at the even, relations at the odd positions of the vote string
+    tokens = [''] * (2 * len(candidates) - 1)
+    gaps = len(candidates) - 1
+    relations = rng.choices(('=', '>'), k=number * gaps)
+    # shuffling the previous permutation again is as random as shuffling a fresh copy
+    parts = list(candidates)
+    for x in range(number):
+        rng.shuffle(parts)
+        tokens[0::2] = parts
+        tokens[1::2] = relations[x * gaps:(x + 1) * gaps]
+        votes.append(VoteString(''.join(tokens)))
+    return votes
+
+
 class MyTest(unittest.TestCase):
+    # The candidates shared by most tests. The first one often takes the role of the bar,
+    # separating the approved from the rejected candidates.
+    BAR = Candidate('0')
+    C1 = Candidate('1')
+    C2 = Candidate('2')
+    C3 = Candidate('3')
+    C4 = Candidate('4')
+    C5 = Candidate('5')
+
+    # The strength functions every evaluation test is run with
+    METRICS = (margin, winning_votes)
+
+    # The votes test_preferential_voting builds its elections from.
+    # This base set is designed to have a nearly homogeneous
+    # distribution (meaning all things are preferred by at most one
+    # vote)
+    BASE_VOTES = (VoteString("0>1>2>3>4"),
+                  VoteString("4>3>2>1>0"),
+                  VoteString("4=0>1=3>2"),
+                  VoteString("3>0>2=4>1"),
+                  VoteString("1>2=3>4=0"),
+                  VoteString("2>1>4>0>3"))
+
+    # the advanced set causes an even more perfect equilibrium
+    ADVANCED_VOTES = (VoteString("4>2>3>1=0"),
+                      VoteString("0>1=3>2=4"),
+                      VoteString("1=2>0=3=4"),
+                      VoteString("0=3=4>1=2"))
+    # most cases add a single vote to the union of both sets
+    EQUILIBRIUM_VOTES = BASE_VOTES + ADVANCED_VOTES
+
+    # The expected results of test_classical_voting
+    CLASSICAL_TESTS: Tuple[ClassicalTestCase, ...] = (
+        ClassicalTestCase(
+            input={(C1,): 3, (C2,): 2, (C3,): 1, (C4,): 0, (C5,): 0, tuple(): 0, None: 0},
+            condensed=VoteString("0=1>2>3>4=5"),
+            detailed=[
+                DRL(preferred=[BAR, C1], rejected=[C2],
+                    support={(BAR, C2): 4, (C1, C2): 3},
+                    opposition={(BAR, C2): 2, (C1, C2): 2}),
+                DRL(preferred=[C2], rejected=[C3],
+                    support={(C2, C3): 2},
+                    opposition={(C2, C3): 1}),
+                DRL(preferred=[C3], rejected=[C4, C5],
+                    support={(C3, C4): 1, (C3, C5): 1},
+                    opposition={(C3, C4): 0, (C3, C5): 0})
+            ]
+        ),
+        ClassicalTestCase(
+            input={(C1,): 9, (C2,): 0, (C3,): 2, (C4,): 1, (C5,): 8, tuple(): 1, None: 5},
+            condensed=VoteString("0>1>5>3>4>2"),
+            detailed=[
+                DRL(preferred=[BAR], rejected=[C1],
+                    support={(BAR, C1): 12},
+                    opposition={(BAR, C1): 9}),
+                DRL(preferred=[C1], rejected=[C5],
+                    support={(C1, C5): 9},
+                    opposition={(C1, C5): 8}),
+                DRL(preferred=[C5], rejected=[C3],
+                    support={(C5, C3): 8},
+                    opposition={(C5, C3): 2}),
+                DRL(preferred=[C3], rejected=[C4],
+                    support={(C3, C4): 2},
+                    opposition={(C3, C4): 1}),
+                DRL(preferred=[C4], rejected=[C2],
+                    support={(C4, C2): 1},
+                    opposition={(C4, C2): 0})
+            ]
+        ),
+        ClassicalTestCase(
+            input={(C1,): 9, (C2,): 8, (C3,): 2, (C4,): 2, (C5,): 8, tuple(): 5, None: 5},
+            condensed=VoteString("0>1>2=5>3=4"),
+            detailed=[
+                DRL(preferred=[BAR], rejected=[C1],
+                    support={(BAR, C1): 25},
+                    opposition={(BAR, C1): 9}),
+                DRL(preferred=[C1], rejected=[C2, C5],
+                    support={(C1, C2): 9, (C1, C5): 9},
+                    opposition={(C1, C2): 8, (C1, C5): 8}),
+                DRL(preferred=[C2, C5], rejected=[C3, C4],
+                    support={(C2, C3): 8, (C2, C4): 8, (C5, C3): 8, (C5, C4): 8},
+                    opposition={(C2, C3): 2, (C2, C4): 2, (C5, C3): 2, (C5, C4): 2})
+            ]
+        ),
+        ClassicalTestCase(
+            input={(C1, C2, C3): 2, (C1, C2): 3, (C3,): 3, (C1, C3): 1, (C2,): 1},
+            condensed=VoteString("1=2=3>0>4=5"),
+            detailed=[
+                DRL(preferred=[C1, C2, C3], rejected=[BAR],
+                    support={(C1, BAR): 6, (C2, BAR): 6, (C3, BAR): 6},
+                    opposition={(C1, BAR): 4, (C2, BAR): 4, (C3, BAR): 4}),
+                DRL(preferred=[BAR], rejected=[C4, C5],
+                    support={(BAR, C4): 10, (BAR, C5): 10},
+                    opposition={(BAR, C4): 0, (BAR, C5): 0})
+            ]
+        ),
+    )
+
+    # The expected results of test_preferential_voting
+    PREFERENTIAL_TESTS: Tuple[PreferentialTestCase, ...] = (
+        PreferentialTestCase(
+            input=BASE_VOTES,
+            condensed=VoteString("0=1>3>2>4"),
+            detailed=[
+                DRL(preferred=[BAR, C1], rejected=[C3],
+                    support={(BAR, C3): 3, (C1, C3): 3},
+                    opposition={(BAR, C3): 3, (C1, C3): 2}),
+                DRL(preferred=[C3], rejected=[C2],
+                    support={(C3, C2): 3},
+                    opposition={(C3, C2): 2}),
+                DRL(preferred=[C2], rejected=[C4],
+                    support={(C2, C4): 3},
+                    opposition={(C2, C4): 2})
+            ]
+        ),
+        PreferentialTestCase(
+            input=BASE_VOTES + (VoteString("4>2>3>0>1"),),
+            condensed=VoteString("2=4>3>0>1"),
+            detailed=[
+                DRL(preferred=[C2, C4], rejected=[C3],
+                    support={(C2, C3): 3, (C4, C3): 4},
+                    opposition={(C2, C3): 3, (C4, C3): 3}),
+                DRL(preferred=[C3], rejected=[BAR],
+                    support={(C3, BAR): 4},
+                    opposition={(C3, BAR): 3}),
+                DRL(preferred=[BAR], rejected=[C1],
+                    support={(BAR, C1): 4},
+                    opposition={(BAR, C1): 3})
+            ]
+        ),
+        PreferentialTestCase(
+            input=BASE_VOTES + (VoteString("4>2>3>1=0"),),
+            condensed=VoteString("2=4>1=3>0"),
+            detailed=[
+                DRL(preferred=[C2, C4], rejected=[C1, C3],
+                    support={(C2, C1): 4, (C2, C3): 3, (C4, C1): 4, (C4, C3): 4},
+                    opposition={(C2, C1): 3, (C2, C3): 3, (C4, C1): 3, (C4, C3): 3}),
+                DRL(preferred=[C1, C3], rejected=[BAR],
+                    support={(C1, BAR): 3, (C3, BAR): 4},
+                    opposition={(C1, BAR): 3, (C3, BAR): 3})
+            ]
+        ),
+        PreferentialTestCase(
+            input=BASE_VOTES + (VoteString("4>2>3>1=0"), VoteString("0>1=3>2=4")),
+            condensed=VoteString("0=3=4>1=2"),
+            detailed=[
+                DRL(preferred=[BAR, C3, C4], rejected=[C1, C2],
+                    support={(BAR, C1): 4, (BAR, C2): 4, (C3, C1): 3, (C3, C2): 4, (C4, C1): 4, (C4, C2): 3},
+                    opposition={(BAR, C1): 3, (BAR, C2): 4, (C3, C1): 3, (C3, C2): 3, (C4, C1): 4, (C4, C2): 3})
+            ]
+        ),
+        PreferentialTestCase(
+            input=BASE_VOTES + (VoteString("4>2>3>1=0"), VoteString("0>1=3>2=4"), VoteString("1=2>0=3=4")),
+            condensed=VoteString("1=2>0=3=4"),
+            detailed=[
+                DRL(preferred=[C1, C2], rejected=[BAR, C3, C4],
+                    support={(C1, BAR): 4, (C1, C3): 4, (C1, C4): 5, (C2, BAR): 5, (C2, C3): 4, (C2, C4): 4},
+                    opposition={(C1, BAR): 4, (C1, C3): 3, (C1, C4): 4, (C2, BAR): 4, (C2, C3): 4, (C2, C4): 3})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES,
+            condensed=VoteString("0=3=4>1=2"),
+            detailed=[
+                DRL(preferred=[BAR, C3, C4], rejected=[C1, C2],
+                    support={(BAR, C1): 5, (BAR, C2): 5, (C3, C1): 4, (C3, C2): 5, (C4, C1): 5, (C4, C2): 4},
+                    opposition={(BAR, C1): 4, (BAR, C2): 5, (C3, C1): 4, (C3, C2): 4, (C4, C1): 5, (C4, C2): 4})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("0>1=2=3=4"),),
+            condensed=VoteString("0>1=3=4>2"),
+            detailed=[
+                DRL(preferred=[BAR], rejected=[C1, C3, C4],
+                    support={(BAR, C1): 6, (BAR, C3): 5, (BAR, C4): 4},
+                    opposition={(BAR, C1): 4, (BAR, C3): 4, (BAR, C4): 3}),
+                DRL(preferred=[C1, C3, C4], rejected=[C2],
+                    support={(C1, C2): 4, (C3, C2): 5, (C4, C2): 4},
+                    opposition={(C1, C2): 4, (C3, C2): 4, (C4, C2): 4})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("1>0=2=3=4"),),
+            condensed=VoteString("0=1>3=4>2"),
+            detailed=[
+                DRL(preferred=[BAR, C1], rejected=[C3, C4],
+                    support={(BAR, C3): 4, (BAR, C4): 3, (C1, C3): 5, (C1, C4): 6},
+                    opposition={(BAR, C3): 4, (BAR, C4): 3, (C1, C3): 4, (C1, C4): 5}),
+                DRL(preferred=[C3, C4], rejected=[C2],
+                    support={(C3, C2): 5, (C4, C2): 4},
+                    opposition={(C3, C2): 4, (C4, C2): 4})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("2>0=1=3=4"),),
+            condensed=VoteString("2=3>0=4>1"),
+            detailed=[
+                DRL(preferred=[C2, C3], rejected=[BAR, C4],
+                    support={(C2, BAR): 6, (C2, C4): 5, (C3, BAR): 4, (C3, C4): 4},
+                    opposition={(C2, BAR): 5, (C2, C4): 4, (C3, BAR): 4, (C3, C4): 4}),
+                DRL(preferred=[BAR, C4], rejected=[C1],
+                    support={(BAR, C1): 5, (C4, C1): 5},
+                    opposition={(BAR, C1): 4, (C4, C1): 5})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("3>0=1=2=4"),),
+            condensed=VoteString("3>0=2=4>1"),
+            detailed=[
+                DRL(preferred=[C3], rejected=[BAR, C2, C4],
+                    support={(C3, BAR): 5, (C3, C2): 6, (C3, C4): 5},
+                    opposition={(C3, BAR): 4, (C3, C2): 4, (C3, C4): 4}),
+                DRL(preferred=[BAR, C2, C4], rejected=[C1],
+                    support={(BAR, C1): 5, (C2, C1): 4, (C4, C1): 5},
+                    opposition={(BAR, C1): 4, (C2, C1): 4, (C4, C1): 5})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("4>0=1=2=3"),),
+            condensed=VoteString("4>0=3>1=2"),
+            detailed=[
+                DRL(preferred=[C4], rejected=[BAR, C3],
+                    support={(C4, BAR): 4, (C4, C3): 5},
+                    opposition={(C4, BAR): 3, (C4, C3): 4}),
+                DRL(preferred=[BAR, C3], rejected=[C1, C2],
+                    support={(BAR, C1): 5, (BAR, C2): 5, (C3, C1): 4, (C3, C2): 5},
+                    opposition={(BAR, C1): 4, (BAR, C2): 5, (C3, C1): 4, (C3, C2): 4})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("0>3>4=1>2"),),
+            condensed=VoteString("0>3>1=4>2"),
+            detailed=[
+                DRL(preferred=[BAR], rejected=[C3],
+                    support={(BAR, C3): 5},
+                    opposition={(BAR, C3): 4}),
+                DRL(preferred=[C3], rejected=[C1, C4],
+                    support={(C3, C1): 5, (C3, C4): 5},
+                    opposition={(C3, C1): 4, (C3, C4): 4}),
+                DRL(preferred=[C1, C4], rejected=[C2],
+                    support={(C1, C2): 5, (C4, C2): 5},
+                    opposition={(C1, C2): 4, (C4, C2): 4})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("0>3>4>1>2"),),
+            condensed=VoteString("0>3>4>1>2"),
+            detailed=[
+                DRL(preferred=[BAR], rejected=[C3],
+                    support={(BAR, C3): 5},
+                    opposition={(BAR, C3): 4}),
+                DRL(preferred=[C3], rejected=[C4],
+                    support={(C3, C4): 5},
+                    opposition={(C3, C4): 4}),
+                DRL(preferred=[C4], rejected=[C1],
+                    support={(C4, C1): 6},
+                    opposition={(C4, C1): 5}),
+                DRL(preferred=[C1], rejected=[C2],
+                    support={(C1, C2): 5},
+                    opposition={(C1, C2): 4})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("2>1>4>3>0"),),
+            condensed=VoteString("2>1>4>3>0"),
+            detailed=[
+                DRL(preferred=[C2], rejected=[C1],
+                    support= {(C2, C1): 5},
+                    opposition={(C2, C1): 4}),
+                DRL(preferred=[C1], rejected=[C4],
+                    support={(C1, C4): 6},
+                    opposition={(C1, C4): 5}),
+                DRL(preferred=[C4], rejected=[C3],
+                    support={(C4, C3): 5},
+                    opposition={(C4, C3): 4}),
+                DRL(preferred=[C3], rejected=[BAR],
+                    support={(C3, BAR): 5},
+                    opposition={(C3, BAR): 4})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("4>3>2>1>0"),),
+            condensed=VoteString("4>3>2>0=1"),
+            detailed=[
+                DRL(preferred=[C4], rejected=[C3],
+                    support={(C4, C3): 5},
+                    opposition={(C4, C3): 4}),
+                DRL(preferred=[C3], rejected=[C2],
+                    support={(C3, C2): 6},
+                    opposition={(C3, C2): 4}),
+                DRL(preferred=[C2], rejected=[BAR, C1],
+                    support={(C2, BAR): 6, (C2, C1): 5},
+                    opposition={(C2, BAR): 5, (C2, C1): 4})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("0>1>2>3>4"),),
+            condensed=VoteString("0>1>2=3>4"),
+            detailed=[
+                DRL(preferred=[BAR], rejected=[C1],
+                    support={(BAR, C1): 6},
+                    opposition={(BAR, C1): 4}),
+                DRL(preferred=[C1], rejected=[C2, C3],
+                    support={(C1, C2): 5, (C1, C3): 5},
+                    opposition={(C1, C2): 4, (C1, C3): 4}),
+                DRL(preferred=[C2, C3], rejected=[C4],
+                    support={(C2, C4): 5, (C3, C4): 5},
+                    opposition={(C2, C4): 4, (C3, C4): 4})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("0=1=2=3>4"),),
+            condensed=VoteString("0=3>1=2>4"),
+            detailed=[
+                DRL(preferred=[BAR, C3], rejected=[C1, C2],
+                    support={(BAR, C1): 5, (BAR, C2): 5, (C3, C1): 4, (C3, C2): 5},
+                    opposition={(BAR, C1): 4, (BAR, C2): 5, (C3, C1): 4, (C3, C2): 4}),
+                DRL(preferred=[C1, C2], rejected=[C4],
+                    support={(C1, C4): 6, (C2, C4): 5},
+                    opposition={(C1, C4): 5, (C2, C4): 4})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("0=1=2=4>3"),),
+            condensed=VoteString("0=2=4>1>3"),
+            detailed=[
+                DRL(preferred=[BAR, C2, C4], rejected=[C1],
+                    support={(BAR, C1): 5, (C2, C1): 4, (C4, C1): 5},
+                    opposition={(BAR, C1): 4, (C2, C1): 4, (C4, C1): 5}),
+                DRL(preferred=[C1], rejected=[C3],
+                    support={(C1, C3): 5},
+                    opposition={(C1, C3): 4})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("0=1=3=4>2"),),
+            condensed=VoteString("0=3=4>1>2"),
+            detailed=[
+                DRL(preferred=[BAR, C3, C4], rejected=[C1],
+                    support={(BAR, C1): 5, (C3, C1): 4, (C4, C1): 5},
+                    opposition={(BAR, C1): 4, (C3, C1): 4, (C4, C1): 5}),
+                DRL(preferred=[C1], rejected=[C2],
+                    support={(C1, C2): 5},
+                    opposition={(C1, C2): 4})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("0=2=3=4>1"),),
+            condensed=VoteString("0=3=4>2>1"),
+            detailed=[
+                DRL(preferred=[BAR, C3, C4], rejected=[C2],
+                    support={(BAR, C2): 5, (C3, C2): 5, (C4, C2): 4},
+                    opposition={(BAR, C2): 5, (C3, C2): 4, (C4, C2): 4}),
+                DRL(preferred=[C2], rejected=[C1],
+                    support={(C2, C1): 5},
+                    opposition={(C2, C1): 4})
+            ]
+        ),
+        PreferentialTestCase(
+            input=EQUILIBRIUM_VOTES + (VoteString("1=2=3=4>0"),),
+            condensed=VoteString("1=3=4>2>0"),
+            detailed=[
+                DRL(preferred=[C1, C3, C4], rejected=[C2],
+                    support={(C1, C2): 4, (C3, C2): 5, (C4, C2): 4},
+                    opposition={(C1, C2): 4, (C3, C2): 4, (C4, C2): 4}),
+                DRL(preferred=[C2], rejected=[BAR],
+                    support={(C2, BAR): 6},
+                    opposition={(C2, BAR): 5})
+            ]
+        ),
+    )
+
     def test_classical_voting(self) -> None:
-        bar = Candidate('0')
-        c1 = Candidate('1')
-        c2 = Candidate('2')
-        c3 = Candidate('3')
-        c4 = Candidate('4')
-        c5 = Candidate('5')
+        bar, c1, c2, c3, c4, c5 = self.BAR, self.C1, self.C2, self.C3, self.C4, self.C5
 
         def _classical_votes(spec: Dict[Optional[Tuple[Candidate, ...]], int],
                              candidates: Tuple[Candidate, ...]) -> List[VoteString]:
-            votes = []
+            votes: List[VoteString] = []
+            # these votes do not depend on the spec entry
+            abstention = '='.join(candidates + (bar,))
+            no_winners = bar + '>' + '='.join(candidates)
             for winners, number in spec.items():
                 if winners is None:
-                    # abstention
-                    vote = '='.join(candidates + (bar,))
+                    vote = abstention
                 elif not winners:
-                    vote = bar + '>' + '='.join(candidates)
+                    vote = no_winners
                 else:
+                    winner_set = set(winners)
                     vote = '='.join(winners) + '>' + bar + '>' + '='.join(
-                        c for c in candidates if c not in winners)
-                votes += [vote] * number
-            return [VoteString(v) for v in votes]
+                        c for c in candidates if c not in winner_set)
+                # all voters with the same winners cast the very same vote string
+                votes.extend(itertools.repeat(VoteString(vote), number))
+            return votes
 
         candidates = (c1, c2, c3, c4, c5)
         candidates_with_bar = (bar,) + candidates
 
-        test_1: ClassicalTestCase = {
-            'input': {(c1,): 3, (c2,): 2, (c3,): 1, (c4,): 0, (c5,): 0, tuple(): 0, None: 0},
-            'condensed': VoteString("0=1>2>3>4=5"),
-            'detailed': [
-                DRL(preferred=[bar, c1], rejected=[c2],
-                    support={(bar, c2): 4, (c1, c2): 3},
-                    opposition={(bar, c2): 2, (c1, c2): 2}),
-                DRL(preferred=[c2], rejected=[c3],
-                    support={(c2, c3): 2},
-                    opposition={(c2, c3): 1}),
-                DRL(preferred=[c3], rejected=[c4, c5],
-                    support={(c3, c4): 1, (c3, c5): 1},
-                    opposition={(c3, c4): 0, (c3, c5): 0})
-            ]
-        }
-        test_2: ClassicalTestCase = {
-            'input': {(c1,): 9, (c2,): 0, (c3,): 2, (c4,): 1, (c5,): 8, tuple(): 1, None: 5},
-            'condensed': VoteString("0>1>5>3>4>2"),
-            'detailed': [
-                DRL(preferred=[bar], rejected=[c1],
-                    support={(bar, c1): 12},
-                    opposition={(bar, c1): 9}),
-                DRL(preferred=[c1], rejected=[c5],
-                    support={(c1, c5): 9},
-                    opposition={(c1, c5): 8}),
-                DRL(preferred=[c5], rejected=[c3],
-                    support={(c5, c3): 8},
-                    opposition={(c5, c3): 2}),
-                DRL(preferred=[c3], rejected=[c4],
-                    support={(c3, c4): 2},
-                    opposition={(c3, c4): 1}),
-                DRL(preferred=[c4], rejected=[c2],
-                    support={(c4, c2): 1},
-                    opposition={(c4, c2): 0})
-            ]
-        }
-        test_3: ClassicalTestCase = {
-            'input': {(c1,): 9, (c2,): 8, (c3,): 2, (c4,): 2, (c5,): 8, tuple(): 5, None: 5},
-            'condensed': VoteString("0>1>2=5>3=4"),
-            'detailed': [
-                DRL(preferred=[bar], rejected=[c1],
-                    support={(bar, c1): 25},
-                    opposition={(bar, c1): 9}),
-                DRL(preferred=[c1], rejected=[c2, c5],
-                    support={(c1, c2): 9, (c1, c5): 9},
-                    opposition={(c1, c2): 8, (c1, c5): 8}),
-                DRL(preferred=[c2, c5], rejected=[c3, c4],
-                    support={(c2, c3): 8, (c2, c4): 8, (c5, c3): 8, (c5, c4): 8},
-                    opposition={(c2, c3): 2, (c2, c4): 2, (c5, c3): 2, (c5, c4): 2})
-            ]
-        }
-        test_4: ClassicalTestCase = {
-            'input': {(c1, c2, c3): 2, (c1, c2): 3, (c3,): 3, (c1, c3): 1, (c2,): 1},
-            'condensed': VoteString("1=2=3>0>4=5"),
-            'detailed': [
-                DRL(preferred=[c1, c2, c3], rejected=[bar],
-                    support={(c1, bar): 6, (c2, bar): 6, (c3, bar): 6},
-                    opposition={(c1, bar): 4, (c2, bar): 4, (c3, bar): 4}),
-                DRL(preferred=[bar], rejected=[c4, c5],
-                    support={(bar, c4): 10, (bar, c5): 10},
-                    opposition={(bar, c4): 0, (bar, c5): 0})
-            ]
-        }
-
-        for metric in {margin, winning_votes}:
-            for test in [test_1, test_2, test_3, test_4]:
+        for test in self.CLASSICAL_TESTS:
+            votes = _classical_votes(test.input, candidates)
+            for metric in self.METRICS:
                 with self.subTest(test=test, metric=metric):
-                    votes = _classical_votes(test['input'], candidates)
                     condensed = schulze_evaluate(
                         votes, candidates_with_bar, strength=metric)
+                    self.assertEqual(test.condensed, condensed)
                     detailed = schulze_evaluate_detailed(
                         votes, candidates_with_bar, strength=metric)
-                    self.assertEqual(test['condensed'], condensed)
-                    self.assertEqual(test['detailed'], detailed)
+                    self.assertEqual(test.detailed, detailed)
 
     def test_preferential_voting(self) -> None:
-        bar = Candidate('0')
-        c1 = Candidate('1')
-        c2 = Candidate('2')
-        c3 = Candidate('3')
-        c4 = Candidate('4')
+        candidates = (self.BAR, self.C1, self.C2, self.C3, self.C4)
 
-        candidates = (bar, c1, c2, c3, c4)
-        # this base set is designed to have a nearly homogeneous
-        # distribution (meaning all things are preferred by at most one
-        # vote)
-        base = [VoteString("0>1>2>3>4"),
-                VoteString("4>3>2>1>0"),
-                VoteString("4=0>1=3>2"),
-                VoteString("3>0>2=4>1"),
-                VoteString("1>2=3>4=0"),
-                VoteString("2>1>4>0>3")]
-
-        # the advanced set causes an even more perfect equilibrium
-        advanced = [VoteString("4>2>3>1=0"),
-                    VoteString("0>1=3>2=4"),
-                    VoteString("1=2>0=3=4"),
-                    VoteString("0=3=4>1=2")]
-
-        tests: List[PreferentialTestCase] = [
-            {
-                'input': base,
-                'condensed': VoteString("0=1>3>2>4"),
-                'detailed': [
-                    DRL(preferred=[bar, c1], rejected=[c3],
-                        support={(bar, c3): 3, (c1, c3): 3},
-                        opposition={(bar, c3): 3, (c1, c3): 2}),
-                    DRL(preferred=[c3], rejected=[c2],
-                        support={(c3, c2): 3},
-                        opposition={(c3, c2): 2}),
-                    DRL(preferred=[c2], rejected=[c4],
-                        support={(c2, c4): 3},
-                        opposition={(c2, c4): 2})
-                ]
-            },
-            {
-                'input': base + [VoteString("4>2>3>0>1")],
-                'condensed': VoteString("2=4>3>0>1"),
-                'detailed': [
-                    DRL(preferred=[c2, c4], rejected=[c3],
-                        support={(c2, c3): 3, (c4, c3): 4},
-                        opposition={(c2, c3): 3, (c4, c3): 3}),
-                    DRL(preferred=[c3], rejected=[bar],
-                        support={(c3, bar): 4},
-                        opposition={(c3, bar): 3}),
-                    DRL(preferred=[bar], rejected=[c1],
-                        support={(bar, c1): 4},
-                        opposition={(bar, c1): 3})
-                ]
-            },
-            {
-                'input': base + [VoteString("4>2>3>1=0")],
-                'condensed': VoteString("2=4>1=3>0"),
-                'detailed': [
-                    DRL(preferred=[c2, c4], rejected=[c1, c3],
-                        support={(c2, c1): 4, (c2, c3): 3, (c4, c1): 4, (c4, c3): 4},
-                        opposition={(c2, c1): 3, (c2, c3): 3, (c4, c1): 3, (c4, c3): 3}),
-                    DRL(preferred=[c1, c3], rejected=[bar],
-                        support={(c1, bar): 3, (c3, bar): 4},
-                        opposition={(c1, bar): 3, (c3, bar): 3})
-                ]
-            },
-            {
-                'input': base + [VoteString("4>2>3>1=0"), VoteString("0>1=3>2=4")],
-                'condensed': VoteString("0=3=4>1=2"),
-                'detailed': [
-                    DRL(preferred=[bar, c3, c4], rejected=[c1, c2],
-                        support={(bar, c1): 4, (bar, c2): 4, (c3, c1): 3, (c3, c2): 4, (c4, c1): 4, (c4, c2): 3},
-                        opposition={(bar, c1): 3, (bar, c2): 4, (c3, c1): 3, (c3, c2): 3, (c4, c1): 4, (c4, c2): 3})
-                ]
-            },
-            {
-                'input': base + [VoteString("4>2>3>1=0"), VoteString("0>1=3>2=4"), VoteString("1=2>0=3=4")],
-                'condensed': VoteString("1=2>0=3=4"),
-                'detailed': [
-                    DRL(preferred=[c1, c2], rejected=[bar, c3, c4],
-                        support={(c1, bar): 4, (c1, c3): 4, (c1, c4): 5, (c2, bar): 5, (c2, c3): 4, (c2, c4): 4},
-                        opposition={(c1, bar): 4, (c1, c3): 3, (c1, c4): 4, (c2, bar): 4, (c2, c3): 4, (c2, c4): 3})
-                ]
-            },
-            {
-                'input': base + advanced,
-                'condensed': VoteString("0=3=4>1=2"),
-                'detailed': [
-                    DRL(preferred=[bar, c3, c4], rejected=[c1, c2],
-                        support={(bar, c1): 5, (bar, c2): 5, (c3, c1): 4, (c3, c2): 5, (c4, c1): 5, (c4, c2): 4},
-                        opposition={(bar, c1): 4, (bar, c2): 5, (c3, c1): 4, (c3, c2): 4, (c4, c1): 5, (c4, c2): 4})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("0>1=2=3=4")],
-                'condensed': VoteString("0>1=3=4>2"),
-                'detailed': [
-                    DRL(preferred=[bar], rejected=[c1, c3, c4],
-                        support={(bar, c1): 6, (bar, c3): 5, (bar, c4): 4},
-                        opposition={(bar, c1): 4, (bar, c3): 4, (bar, c4): 3}),
-                    DRL(preferred=[c1, c3, c4], rejected=[c2],
-                        support={(c1, c2): 4, (c3, c2): 5, (c4, c2): 4},
-                        opposition={(c1, c2): 4, (c3, c2): 4, (c4, c2): 4})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("1>0=2=3=4")],
-                'condensed': VoteString("0=1>3=4>2"),
-                'detailed': [
-                    DRL(preferred=[bar, c1], rejected=[c3, c4],
-                        support={(bar, c3): 4, (bar, c4): 3, (c1, c3): 5, (c1, c4): 6},
-                        opposition={(bar, c3): 4, (bar, c4): 3, (c1, c3): 4, (c1, c4): 5}),
-                    DRL(preferred=[c3, c4], rejected=[c2],
-                        support={(c3, c2): 5, (c4, c2): 4},
-                        opposition={(c3, c2): 4, (c4, c2): 4})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("2>0=1=3=4")],
-                'condensed': VoteString("2=3>0=4>1"),
-                'detailed': [
-                    DRL(preferred=[c2, c3], rejected=[bar, c4],
-                        support={(c2, bar): 6, (c2, c4): 5, (c3, bar): 4, (c3, c4): 4},
-                        opposition={(c2, bar): 5, (c2, c4): 4, (c3, bar): 4, (c3, c4): 4}),
-                    DRL(preferred=[bar, c4], rejected=[c1],
-                        support={(bar, c1): 5, (c4, c1): 5},
-                        opposition={(bar, c1): 4, (c4, c1): 5})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("3>0=1=2=4")],
-                'condensed': VoteString("3>0=2=4>1"),
-                'detailed': [
-                    DRL(preferred=[c3], rejected=[bar, c2, c4],
-                        support={(c3, bar): 5, (c3, c2): 6, (c3, c4): 5},
-                        opposition={(c3, bar): 4, (c3, c2): 4, (c3, c4): 4}),
-                    DRL(preferred=[bar, c2, c4], rejected=[c1],
-                        support={(bar, c1): 5, (c2, c1): 4, (c4, c1): 5},
-                        opposition={(bar, c1): 4, (c2, c1): 4, (c4, c1): 5})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("4>0=1=2=3")],
-                'condensed': VoteString("4>0=3>1=2"),
-                'detailed': [
-                    DRL(preferred=[c4], rejected=[bar, c3],
-                        support={(c4, bar): 4, (c4, c3): 5},
-                        opposition={(c4, bar): 3, (c4, c3): 4}),
-                    DRL(preferred=[bar, c3], rejected=[c1, c2],
-                        support={(bar, c1): 5, (bar, c2): 5, (c3, c1): 4, (c3, c2): 5},
-                        opposition={(bar, c1): 4, (bar, c2): 5, (c3, c1): 4, (c3, c2): 4})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("0>3>4=1>2")],
-                'condensed': VoteString("0>3>1=4>2"),
-                'detailed': [
-                    DRL(preferred=[bar], rejected=[c3],
-                        support={(bar, c3): 5},
-                        opposition={(bar, c3): 4}),
-                    DRL(preferred=[c3], rejected=[c1, c4],
-                        support={(c3, c1): 5, (c3, c4): 5},
-                        opposition={(c3, c1): 4, (c3, c4): 4}),
-                    DRL(preferred=[c1, c4], rejected=[c2],
-                        support={(c1, c2): 5, (c4, c2): 5},
-                        opposition={(c1, c2): 4, (c4, c2): 4})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("0>3>4>1>2")],
-                'condensed': VoteString("0>3>4>1>2"),
-                'detailed': [
-                    DRL(preferred=[bar], rejected=[c3],
-                        support={(bar, c3): 5},
-                        opposition={(bar, c3): 4}),
-                    DRL(preferred=[c3], rejected=[c4],
-                        support={(c3, c4): 5},
-                        opposition={(c3, c4): 4}),
-                    DRL(preferred=[c4], rejected=[c1],
-                        support={(c4, c1): 6},
-                        opposition={(c4, c1): 5}),
-                    DRL(preferred=[c1], rejected=[c2],
-                        support={(c1, c2): 5},
-                        opposition={(c1, c2): 4})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("2>1>4>3>0")],
-                'condensed': VoteString("2>1>4>3>0"),
-                'detailed': [
-                    DRL(preferred=[c2], rejected=[c1],
-                        support= {(c2, c1): 5},
-                        opposition={(c2, c1): 4}),
-                    DRL(preferred=[c1], rejected=[c4],
-                        support={(c1, c4): 6},
-                        opposition={(c1, c4): 5}),
-                    DRL(preferred=[c4], rejected=[c3],
-                        support={(c4, c3): 5},
-                        opposition={(c4, c3): 4}),
-                    DRL(preferred=[c3], rejected=[bar],
-                        support={(c3, bar): 5},
-                        opposition={(c3, bar): 4})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("4>3>2>1>0")],
-                'condensed': VoteString("4>3>2>0=1"),
-                'detailed': [
-                    DRL(preferred=[c4], rejected=[c3],
-                        support={(c4, c3): 5},
-                        opposition={(c4, c3): 4}),
-                    DRL(preferred=[c3], rejected=[c2],
-                        support={(c3, c2): 6},
-                        opposition={(c3, c2): 4}),
-                    DRL(preferred=[c2], rejected=[bar, c1],
-                        support={(c2, bar): 6, (c2, c1): 5},
-                        opposition={(c2, bar): 5, (c2, c1): 4})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("0>1>2>3>4")],
-                'condensed': VoteString("0>1>2=3>4"),
-                'detailed': [
-                    DRL(preferred=[bar], rejected=[c1],
-                        support={(bar, c1): 6},
-                        opposition={(bar, c1): 4}),
-                    DRL(preferred=[c1], rejected=[c2, c3],
-                        support={(c1, c2): 5, (c1, c3): 5},
-                        opposition={(c1, c2): 4, (c1, c3): 4}),
-                    DRL(preferred=[c2, c3], rejected=[c4],
-                        support={(c2, c4): 5, (c3, c4): 5},
-                        opposition={(c2, c4): 4, (c3, c4): 4})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("0=1=2=3>4")],
-                'condensed': VoteString("0=3>1=2>4"),
-                'detailed': [
-                    DRL(preferred=[bar, c3], rejected=[c1, c2],
-                        support={(bar, c1): 5, (bar, c2): 5, (c3, c1): 4, (c3, c2): 5},
-                        opposition={(bar, c1): 4, (bar, c2): 5, (c3, c1): 4, (c3, c2): 4}),
-                    DRL(preferred=[c1, c2], rejected=[c4],
-                        support={(c1, c4): 6, (c2, c4): 5},
-                        opposition={(c1, c4): 5, (c2, c4): 4})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("0=1=2=4>3")],
-                'condensed': VoteString("0=2=4>1>3"),
-                'detailed': [
-                    DRL(preferred=[bar, c2, c4], rejected=[c1],
-                        support={(bar, c1): 5, (c2, c1): 4, (c4, c1): 5},
-                        opposition={(bar, c1): 4, (c2, c1): 4, (c4, c1): 5}),
-                    DRL(preferred=[c1], rejected=[c3],
-                        support={(c1, c3): 5},
-                        opposition={(c1, c3): 4})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("0=1=3=4>2")],
-                'condensed': VoteString("0=3=4>1>2"),
-                'detailed': [
-                    DRL(preferred=[bar, c3, c4], rejected=[c1],
-                        support={(bar, c1): 5, (c3, c1): 4, (c4, c1): 5},
-                        opposition={(bar, c1): 4, (c3, c1): 4, (c4, c1): 5}),
-                    DRL(preferred=[c1], rejected=[c2],
-                        support={(c1, c2): 5},
-                        opposition={(c1, c2): 4})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("0=2=3=4>1")],
-                'condensed': VoteString("0=3=4>2>1"),
-                'detailed': [
-                    DRL(preferred=[bar, c3, c4], rejected=[c2],
-                        support={(bar, c2): 5, (c3, c2): 5, (c4, c2): 4},
-                        opposition={(bar, c2): 5, (c3, c2): 4, (c4, c2): 4}),
-                    DRL(preferred=[c2], rejected=[c1],
-                        support={(c2, c1): 5},
-                        opposition={(c2, c1): 4})
-                ]
-            },
-            {
-                'input': base + advanced + [VoteString("1=2=3=4>0")],
-                'condensed': VoteString("1=3=4>2>0"),
-                'detailed': [
-                    DRL(preferred=[c1, c3, c4], rejected=[c2],
-                        support={(c1, c2): 4, (c3, c2): 5, (c4, c2): 4},
-                        opposition={(c1, c2): 4, (c3, c2): 4, (c4, c2): 4}),
-                    DRL(preferred=[c2], rejected=[bar],
-                        support={(c2, bar): 6},
-                        opposition={(c2, bar): 5})
-                ]
-            },
-        ]
-
-        for metric in {margin, winning_votes}:
-            for test in tests:
+        for metric in self.METRICS:
+            for test in self.PREFERENTIAL_TESTS:
                 with self.subTest(test=test, metric=metric):
                     condensed = schulze_evaluate(
-                        test['input'], candidates, strength=metric)
+                        test.input, candidates, strength=metric)
+                    self.assertEqual(test.condensed, condensed)
                     detailed = schulze_evaluate_detailed(
-                        test['input'], candidates, strength=metric)
-                    self.assertEqual(test['condensed'], condensed)
-                    self.assertEqual(test['detailed'], detailed)
+                        test.input, candidates, strength=metric)
+                    self.assertEqual(test.detailed, detailed)
 
     def test_runtime(self) -> None:
         # silly test, since I just realized, that the algorithm runtime is
         # linear in the number of votes, but a bit more scary in the number
         # of candidates
-        bar = Candidate('0')
-        c1 = Candidate('1')
-        c2 = Candidate('2')
-        c3 = Candidate('3')
-        c4 = Candidate('4')
+        bar, c1, c2, c3, c4 = self.BAR, self.C1, self.C2, self.C3, self.C4
 
         candidates = (bar, c1, c2, c3, c4)
-        votes = []
-        for _ in range(2000):
-            parts = list(candidates)
-            random.shuffle(parts)
-            relations = (random.choice(('=', '>')) for _ in range(len(candidates)))
-            vote = ''.join(c + r for c, r in zip(candidates, relations))
-            # zip the last char of the string
-            vote = VoteString(vote[:-1])
-            votes.append(vote)
+        # use a fixed seed, so the timings are comparable between runs
+        votes = _random_votes(random.Random(0), candidates, 2000)
+        # 5 milliseconds, in nanoseconds
+        reference = 5_000_000
+        # warm up caches, like the generated code for this number of candidates
+        schulze_evaluate(votes[:10], candidates)
         times = {}
         for num in (10, 100, 1000, 2000):
-            start = datetime.datetime.utcnow()
-            for _ in range(10):
+            # Do up to ten repetitions, but stop as soon as a fraction of the allowed time
+            # has been used. The time of ten repetitions is then extrapolated.
+            budget = num * reference // 10
+            repetitions = 0
+            start = time.perf_counter_ns()
+            while repetitions < 10:
                 schulze_evaluate(votes[:num], candidates)
-            stop = datetime.datetime.utcnow()
-            times[num] = stop - start
-        reference = datetime.timedelta(milliseconds=5)
+                repetitions += 1
+                stop = time.perf_counter_ns()
+                if stop - start > budget:
+                    break
+            times[num] = (stop - start) * 10 // repetitions
         for num, delta in times.items():
             self.assertGreater(num * reference, delta)
 
     def test_candidates_consistency(self) -> None:
-        bar = Candidate('0')
-        c1 = Candidate('1')
-        c2 = Candidate('2')
-        c3 = Candidate('3')
+        bar, c1, c2, c3 = self.BAR, self.C1, self.C2, self.C3
         einstein = Candidate('einstein')
         hawking = Candidate('hawking')
         bose = Candidate('bose')
@@ -493,10 +522,25 @@ class MyTest(unittest.TestCase):
         self.assertEqual(str(cm.exception),
                          "Every candidate must occur exactly once in each vote.")
 
+        # forbidden characters in candidates
+        for forbidden in ([einstein, Candidate('fermi>bose')], [Candidate('=')]):
+            with self.subTest(candidates=forbidden):
+                with self.assertRaises(ValueError) as cm:
+                    schulze_evaluate([], forbidden)
+                self.assertEqual(str(cm.exception),
+                                 "A candidate contains a forbidden character.")
+
+    def test_duplicate_candidates(self) -> None:
+        # duplicated candidates are accepted, but each vote names them only once
+        candidates = (Candidate('c'), Candidate('d'), Candidate('b'), Candidate('d'))
+        self.assertEqual("c>b>d=d", schulze_evaluate([VoteString('c>b>d')], candidates))
+        with self.assertRaises(ValueError) as cm:
+            schulze_evaluate([VoteString('c>b>d>d')], candidates)
+        self.assertEqual(str(cm.exception),
+                         "Every candidate must occur exactly once in each vote.")
+
     def test_result_order(self) -> None:
-        c0 = Candidate("0")
-        c1 = Candidate("1")
-        c2 = Candidate("2")
+        c0, c1, c2 = self.BAR, self.C1, self.C2
 
         candidates = (c0, c1, c2)
         reference_votes = [VoteString("0=1>2"), VoteString("0=1=2")]
@@ -518,6 +562,59 @@ class MyTest(unittest.TestCase):
         condensed = schulze_evaluate(reference_votes, candidates)
         self.assertEqual("1=0>2", condensed)
 
+    def test_iterative_evaluation(self) -> None:
+        # After the winners are determined, the strongest paths between the remaining
+        # candidates have to be determined anew, since the strongest paths through the
+        # winners are not available any more. Reusing the strongest paths between all
+        # candidates would give "5>2=3>0=6>4>1" here.
+        candidates = [Candidate(str(c)) for c in range(7)]
+        votes = [VoteString("0=3=2=4>1=5=6"), VoteString("1=0>5>2=4=6=3"),
+                 VoteString("5=1=3=2=6=0=4"), VoteString("4=3=1>2=6>5>0"),
+                 VoteString("5>3=6=2>0>4>1"), VoteString("2=5=4>3>1=0=6"),
+                 VoteString("3=2>6=0>1=4>5"), VoteString("6>0=5>4>2>1>3"),
+                 VoteString("0=6=5=4>3=2=1")]
+        self.assertEqual("5>2=3>6>0>4>1", schulze_evaluate(votes, candidates))
+
+    def test_custom_strength(self) -> None:
+        # the builtin strength functions are evaluated on the whole matrix at once,
+        # custom strength functions link by link. Both have to give the same result.
+        def custom_winning_votes(*, support: int, opposition: int, totalvotes: int) -> int:
+            return winning_votes(support=support, opposition=opposition,
+                                 totalvotes=totalvotes)
+
+        def custom_margin(*, support: int, opposition: int, totalvotes: int) -> int:
+            return margin(support=support, opposition=opposition, totalvotes=totalvotes)
+
+        candidates = [Candidate(c) for c in "abcdef"]
+        # use a fixed seed, so a failure can be reproduced
+        votes = _random_votes(random.Random(0), candidates, 100)
+        for metric, custom_metric in ((winning_votes, custom_winning_votes),
+                                      (margin, custom_margin)):
+            with self.subTest(metric=metric):
+                self.assertEqual(
+                    schulze_evaluate_detailed(votes, candidates, strength=metric),
+                    schulze_evaluate_detailed(votes, candidates, strength=custom_metric))
+
+    def test_unrolled_strongest_paths(self) -> None:
+        # for few candidates, the strongest paths are determined by generated code,
+        # which has to agree with the generic implementation
+        module = schulze_condorcet.schulze_condorcet
+        # use a fixed seed, so a failure can be reproduced
+        rng = random.Random(0)
+        for n in range(1, module._UNROLL_LIMIT + 1):
+            for _ in range(20):
+                # a small range of strengths, so there are ties between paths
+                d = [[rng.randrange(-3, 10) for _ in range(n)] for _ in range(n)]
+                with self.subTest(d=d):
+                    generic = [list(row) for row in d]
+                    module._strongest_paths(generic)
+                    unrolled = [strength for row in d for strength in row]
+                    module._unrolled_strongest_paths(n)(unrolled)
+                    # the diagonal is meaningless and only updated by the generic code
+                    self.assertEqual(
+                        [generic[x][y] for x in range(n) for y in range(n) if x != y],
+                        [unrolled[x * n + y] for x in range(n) for y in range(n) if x != y])
+
     def test_util(self) -> None:
         candidates = ["1", "2", "3"]
         # This does only static type conversion